@@ -2,6 +2,9 @@
 """A tool that works with configuration as code (CasC) files for Jenkins."""
 # Standard Library Imports
 import argparse
+import concurrent.futures
+import functools
+import io
 import os
 import pathlib
 import re
@@ -13,32 +16,34 @@ from os.path import join
 
 # Third Party Imports
 from pylib.argparse import CustomRawDescriptionHelpFormatter
-import ruamel.yaml
 
-# import inspired from:
-# https://stackoverflow.com/questions/35433838/how-to-dump-a-folded-scalar-to-yaml-in-python-using-ruamel#answer-51980082
-from ruamel.yaml import scalarstring
-import toml
+# ruamel.yaml and toml are imported where they are used, not every subcommand
+# needs them
 
 # Local Application Imports
 
 # constants and other program configurations
 _PROGRAM_NAME = os.path.basename(os.path.abspath(__file__))
 _PROGRAM_ROOT = os.getcwd()
+# max_help_position is increased (default is 24) to allow
+# arguments/options help messages be more indented, reference:
+# https://stackoverflow.com/questions/46554084/how-to-reduce-indentation-level-of-argument-help-in-argparse
+_HELP_FORMATTER = functools.partial(
+    CustomRawDescriptionHelpFormatter, max_help_position=35
+)
 _arg_parser = argparse.ArgumentParser(
     description=__doc__,
-    formatter_class=lambda prog: CustomRawDescriptionHelpFormatter(
-        prog, max_help_position=35
-    ),
+    formatter_class=_HELP_FORMATTER,
     allow_abbrev=False,
 )
 
-YAML_PARSER = ruamel.yaml.YAML()
 YAML_PARSER_WIDTH = 1000
-YAML_PARSER.width = YAML_PARSER_WIDTH
 REPOS_TO_TRANSFER_DIR_NAME = "projects"
 DEFAULT_STDOUT_FD = sys.stdout
 READ_FILE_FROM_WORKSPACE_ARGUMENT_PLACEHOLDER = "__PLACEHOLDER__"
+PWD_IDENTIFIER = "./"
+# every readFileFromWorkspace expression starts with this
+READ_FILE_FROM_WORKSPACE_CALL = "readFileFromWorkspace("
 READ_FILE_FROM_WORKSPACE_EXPRESSION_REPLACEMENT = (
     f"new File('{READ_FILE_FROM_WORKSPACE_ARGUMENT_PLACEHOLDER}').text"
 )
@@ -46,8 +51,13 @@ DEFAULT_BASE_IMAGE_REPO_URL = (
     "https://github.com/cavcrosby/jenkins-docker-base"
 )
 DEFAULT_BASE_IMAGE_REPO_NAME = os.path.basename(DEFAULT_BASE_IMAGE_REPO_URL)
+_DEFAULT_BASE_IMAGE_REPO_DIR = pathlib.Path(
+    _PROGRAM_ROOT, DEFAULT_BASE_IMAGE_REPO_NAME
+)
 GIT_CONFIG_FILE_PATH = "./jobs.toml"
-PROJECTS_DIR_PATH = f"{_PROGRAM_ROOT}/{REPOS_TO_TRANSFER_DIR_NAME}"
+MAX_GIT_CLONE_JOBS = 8
+PROJECTS_DIR_PATH = join(_PROGRAM_ROOT, REPOS_TO_TRANSFER_DIR_NAME)
+_PROJECTS_DIR = pathlib.Path(PROJECTS_DIR_PATH)
 
 # regexes
 
@@ -61,11 +71,22 @@ READ_FILE_FROM_WORKSPACE_EXPRESSION_REGEX = (
 READ_FILE_FROM_WORKSPACE_ARGUMENT_REGEX = (
     r"(?<=readFileFromWorkspace\(').+(?='\))"
 )
-PWD_IDENTIFIER_REGEX = r"\.\/"
 SHELL_VARIABLE_REGEX = r"\$[a-zA-Z_]\w*$|\$\{{1}\w+\}{1}"
 # assumes that any parsing will be on vars that are known shell variables
 SHELL_VARIABLE_NAME_REGEX = r"(?<=\$\{)\w+(?=\})|(?<=\$)[a-zA-Z_]\w*"
-ENV_VAR_REGEX = r"^[a-zA-Z_]\w*=.+"
+
+# compiled once here, instead of on each use
+
+_JOB_DSL_FILENAME_RE = re.compile(JOB_DSL_FILENAME_REGEX)
+_CASC_FILENAME_RE = re.compile(CASC_FILENAME_REGEX)
+_READ_FILE_FROM_WORKSPACE_EXPRESSION_RE = re.compile(
+    READ_FILE_FROM_WORKSPACE_EXPRESSION_REGEX
+)
+_READ_FILE_FROM_WORKSPACE_ARGUMENT_RE = re.compile(
+    READ_FILE_FROM_WORKSPACE_ARGUMENT_REGEX
+)
+_SHELL_VARIABLE_RE = re.compile(SHELL_VARIABLE_REGEX)
+_SHELL_VARIABLE_NAME_RE = re.compile(SHELL_VARIABLE_NAME_REGEX)
 
 # jenkins configurations as code (CasC) key values ({jenkins: {...}})
 
@@ -115,6 +136,9 @@ MERGE_CASC_LONG_OPTION = "merge_casc"
 MERGE_CASC_CLI_NAME = MERGE_CASC_LONG_OPTION.replace("_", "-")
 NUM_OF_AGENTS_TO_ADD_SHORT_OPTION = "n"
 NUM_OF_AGENTS_TO_ADD_LONG_OPTION = "numagents"
+SAFE_LOAD_SHORT_OPTION = "s"
+SAFE_LOAD_LONG_OPTION = "safe_load"
+SAFE_LOAD_CLI_NAME = SAFE_LOAD_LONG_OPTION.replace("_", "-")
 TRANSFORM_READ_FILE_FROM_WORKSPACE_SHORT_OPTION = "t"
 TRANSFORM_READ_FILE_FROM_WORKSPACE_LONG_OPTION = "transform_rffw"
 TRANSFORM_READ_FILE_FROM_WORKSPACE_CLI_NAME = (
@@ -150,6 +174,15 @@ _common_parser.add_argument(
     help="merge another casc file into the loaded casc",
     metavar="CASC_PATH",
 )
+_common_parser.add_argument(
+    f"-{SAFE_LOAD_SHORT_OPTION}",
+    f"--{SAFE_LOAD_CLI_NAME}",
+    action="store_true",
+    help=(
+        "load casc files with the faster safe loader (drops comments, "
+        "fails on custom tags and normalizes scalars)"
+    ),
+)
 
 
 class JcascFile:
@@ -159,7 +192,7 @@ class JcascFile:
     ----------
     type_ : str
         A simple string denoting what kind of file (e.g. casc, job-dsl).
-    regex : str
+    regex : str or re.Pattern
         Regex for the file name.
     *args : tuple
         Directory paths relative in a project containing Jcasc files.
@@ -176,15 +209,95 @@ class JcascFile:
     def __init__(self, type_, regex, *args):
 
         self.type_ = type_
-        self.regex = regex
+        self.regex = re.compile(regex)
         self.dir_paths = args
         if not self.dir_paths:
             self.dir_paths = (self.DEFAULT_DIR_PATH,)
 
     def __str__(self):  # noqa: D105
         return (
-            f"(type={self.type_}, regex={self.regex}, paths={self.dir_paths})"
+            f"(type={self.type_}, regex={self.regex.pattern}, "
+            f"paths={self.dir_paths})"
+        )
+
+    def matches(self, filename):
+        """Check if a file name belongs to this kind of Jcasc file.
+
+        Parameters
+        ----------
+        filename : str
+            The file name to check.
+
+        Returns
+        -------
+        bool
+            If the file name matches the file name regex.
+
+        """
+        return self.regex.search(filename) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_parser():
+    """Get the round-trip yaml parser, used to load and dump the casc.
+
+    Returns
+    -------
+    ruamel.yaml.YAML
+        The yaml parser.
+
+    """
+    import ruamel.yaml
+
+    yaml_parser = ruamel.yaml.YAML()
+    yaml_parser.width = YAML_PARSER_WIDTH
+    return yaml_parser
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader():
+    """Get the safe yaml parser, used to load casc files.
+
+    Returns
+    -------
+    ruamel.yaml.YAML
+        The yaml parser.
+
+    Notes
+    -----
+    This is backed by libyaml (through ruamel.yaml.clib) when available,
+    which is much faster than the pure Python round-trip loader. However,
+    comments are not kept, custom tags cannot be loaded and scalars are
+    normalized (e.g. 010 is dumped as 10), so it is only used when asked for.
+
+    """
+    import ruamel.yaml
+
+    if not ruamel.yaml.__with_libyaml__:
+        print(
+            f"{_PROGRAM_NAME}: libyaml bindings are not available, loading "
+            "will be slow (try 'pip install ruamel.yaml.clib')",
+            file=sys.stderr,
         )
+    return ruamel.yaml.YAML(typ="safe", pure=False)
+
+
+def _casc_loader(safe_load):
+    """Get the yaml parser used to load casc files.
+
+    Parameters
+    ----------
+    safe_load : bool
+        Whether or not to load with the safe loader instead of the
+        round-trip parser.
+
+    Returns
+    -------
+    ruamel.yaml.YAML
+        The yaml parser.
+
+    """
+    return _yaml_loader() if safe_load else _yaml_parser()
 
 
 def _meets_job_dsl_filereqs(repo_name, job_dsl_files):
@@ -272,15 +385,13 @@ def _find_jcasc_files(jcasc_file_meta, project_path):
         The file paths found.
 
     """
-    regex = re.compile(jcasc_file_meta.regex)
     file_paths = []
     for dir_path in jcasc_file_meta.dir_paths:
         try:
-            for file in os.listdir(join(project_path, dir_path)):
-                if regex.search(file):
-                    file_paths.append(
-                        join(project_path, dir_path, pathlib.Path(file))
-                    )
+            with os.scandir(join(project_path, dir_path)) as entries:
+                for entry in entries:
+                    if entry.is_file() and jcasc_file_meta.matches(entry.name):
+                        file_paths.append(entry.path)
         except FileNotFoundError:
             continue
 
@@ -308,14 +419,18 @@ def _expand_env_vars(file, env_vars):
         If any of the env variable pairs passed in are invalid.
 
     """
-    # will check for '<key>=<value>' format
+    # will check for '<key>=<value>' format, where the key is a valid
+    # (ASCII) variable name and the value is not empty
     env_var_names_to_values = dict()
     for env_var in env_vars:
-        regex = re.compile(ENV_VAR_REGEX)
-        if regex.search(env_var):
-            env_var_names_to_values[env_var.split("=")[0]] = env_var.split(
-                "="
-            )[1]
+        env_var_name, sep, env_var_value = env_var.partition("=")
+        if (
+            sep
+            and env_var_value
+            and env_var_name.isascii()
+            and env_var_name.isidentifier()
+        ):
+            env_var_names_to_values[env_var_name] = env_var_value
         else:
             print(
                 f"{_PROGRAM_NAME}: '{env_var}' env var is not formatted "
@@ -324,52 +439,58 @@ def _expand_env_vars(file, env_vars):
             )
             sys.exit(1)
 
-    buffer = []
-    for line in file.splitlines(keepends=True):
-        line_env_vars = re.findall(SHELL_VARIABLE_REGEX, line)
-        modified_line = line
-        if line_env_vars:
-            # I do not want duplicate env vars recorded, overriding the env
-            # var value works to my benefit here since each env var value
-            # will be the same.
-            line_env_var_names_to_env_vars = {
-                list(pair.keys())[0]: list(pair.values())[0]
-                for pair in list(
-                    map(
-                        lambda env_var: {
-                            re.search(SHELL_VARIABLE_NAME_REGEX, env_var)[
-                                0
-                            ]: env_var
-                        },
-                        line_env_vars,
-                    )
-                )
-            }
-            for env_var_name in env_var_names_to_values.keys():
-                if env_var_name in line_env_var_names_to_env_vars:
-                    modified_line = re.sub(
-                        re.escape(
-                            line_env_var_names_to_env_vars[env_var_name]
-                        ),
-                        env_var_names_to_values[env_var_name],
-                        modified_line,
-                    )
-        buffer.append(modified_line)
-    return "".join(buffer)
+    # A shell variable always starts with '$', so lines without one are passed
+    # through as is instead of going through the regexes below.
+    return "".join(
+        _expand_env_vars_in_line(line, env_var_names_to_values)
+        if "$" in line
+        else line
+        for line in file.splitlines(keepends=True)
+    )
 
 
-def retrieve_cmd_args():
-    """How arguments are retrieved from the command line.
+def _expand_env_vars_in_line(line, env_var_names_to_values):
+    """Evaluate env variables in a line of a file.
+
+    Parameters
+    ----------
+    line : str
+        Represents a line from the contents of a file.
+    env_var_names_to_values : dict of str
+        Env variable names mapped to their values.
 
     Returns
     -------
-    Namespace
-        An object that holds attributes pulled from the command line.
+    str
+        Same line but with env variables evaluated.
 
-    Raises
-    ------
-    SystemExit
-        If user input is not considered valid when parsing arguments.
+    """
+    modified_line = line
+    # I do not want duplicate env vars recorded, overriding the env
+    # var value works to my benefit here since each env var value
+    # will be the same.
+    line_env_var_names_to_env_vars = {
+        _SHELL_VARIABLE_NAME_RE.search(env_var)[0]: env_var
+        for env_var in _SHELL_VARIABLE_RE.findall(line)
+    }
+    if line_env_var_names_to_env_vars:
+        for env_var_name, env_var_value in env_var_names_to_values.items():
+            if env_var_name in line_env_var_names_to_env_vars:
+                modified_line = modified_line.replace(
+                    line_env_var_names_to_env_vars[env_var_name],
+                    env_var_value,
+                )
+    return modified_line
+
+
+@functools.lru_cache(maxsize=None)
+def _add_subparsers():
+    """Add the subcommand parsers to the program's argument parser.
+
+    Notes
+    -----
+    The command line grammar does not change while the program runs, so the
+    subparsers are only constructed on the first call.
 
     """
 
@@ -380,70 +501,77 @@ def retrieve_cmd_args():
             raise ValueError
         return string_int
 
-    try:
-        # addjobs
-        # max_help_position is increased (default is 24) to allow
-        # arguments/options help messages be more indented, reference:
-        # https://stackoverflow.com/questions/46554084/how-to-reduce-indentation-level-of-argument-help-in-argparse
-        addjobs = _arg_subparsers.add_parser(
-            ADDJOBS_SUBCOMMAND,
-            help=(
-                "will add Jenkins jobs to loaded configuration based on "
-                "job-dsl file(s) in repo(s)"
-            ),
-            formatter_class=lambda prog: CustomRawDescriptionHelpFormatter(
-                prog, max_help_position=35
-            ),
-            allow_abbrev=False,
-            parents=[_common_parser],
-        )
-        addjobs.add_argument(
-            f"-{TRANSFORM_READ_FILE_FROM_WORKSPACE_SHORT_OPTION}",
-            f"--{TRANSFORM_READ_FILE_FROM_WORKSPACE_CLI_NAME}",
-            action="store_true",
-            help=(
-                "transform readFileFromWorkspace functions to enable "
-                "usage with casc && job-dsl plugin"
-            ),
-        )
+    # addjobs
+    addjobs = _arg_subparsers.add_parser(
+        ADDJOBS_SUBCOMMAND,
+        help=(
+            "will add Jenkins jobs to loaded configuration based on "
+            "job-dsl file(s) in repo(s)"
+        ),
+        formatter_class=_HELP_FORMATTER,
+        allow_abbrev=False,
+        parents=[_common_parser],
+    )
+    addjobs.add_argument(
+        f"-{TRANSFORM_READ_FILE_FROM_WORKSPACE_SHORT_OPTION}",
+        f"--{TRANSFORM_READ_FILE_FROM_WORKSPACE_CLI_NAME}",
+        action="store_true",
+        help=(
+            "transform readFileFromWorkspace functions to enable "
+            "usage with casc && job-dsl plugin"
+        ),
+    )
+
+    # addagent-placeholder
+    addagent_placeholder = _arg_subparsers.add_parser(
+        ADDAGENT_PLACEHOLDER_SUBCOMMAND,
+        help=(
+            "will add a placeholder(s) for a new jenkins agent, to be "
+            "defined at run time"
+        ),
+        formatter_class=_HELP_FORMATTER,
+        allow_abbrev=False,
+        parents=[_common_parser],
+    )
+    addagent_placeholder.add_argument(
+        f"-{NUM_OF_AGENTS_TO_ADD_SHORT_OPTION}",
+        f"--{NUM_OF_AGENTS_TO_ADD_LONG_OPTION}",
+        default=1,
+        type=positive_int,
+        help="number of agents (with their placeholders) to add",
+    )
+
+    # setup
+    setup = _arg_subparsers.add_parser(
+        SETUP_SUBCOMMAND,
+        help="invoked before running docker-build",
+        formatter_class=_HELP_FORMATTER,
+        allow_abbrev=False,
+    )
+    setup.add_argument(
+        f"-{CLEAN_SHORT_OPTION}",
+        f"--{CLEAN_LONG_OPTION}",
+        action="store_true",
+        help="clean PWD of the contents added by setup subcommand",
+    )
 
-        # addagent-placeholder
-        addagent_placeholder = _arg_subparsers.add_parser(
-            ADDAGENT_PLACEHOLDER_SUBCOMMAND,
-            help=(
-                "will add a placeholder(s) for a new jenkins agent, to be "
-                "defined at run time"
-            ),
-            formatter_class=lambda prog: CustomRawDescriptionHelpFormatter(
-                prog, max_help_position=35
-            ),
-            allow_abbrev=False,
-            parents=[_common_parser],
-        )
-        addagent_placeholder.add_argument(
-            f"-{NUM_OF_AGENTS_TO_ADD_SHORT_OPTION}",
-            f"--{NUM_OF_AGENTS_TO_ADD_LONG_OPTION}",
-            default=1,
-            type=positive_int,
-            help="number of agents (with their placeholders) to add",
-        )
 
-        # setup
-        setup = _arg_subparsers.add_parser(
-            SETUP_SUBCOMMAND,
-            help="invoked before running docker-build",
-            formatter_class=lambda prog: CustomRawDescriptionHelpFormatter(
-                prog, max_help_position=35
-            ),
-            allow_abbrev=False,
-        )
-        setup.add_argument(
-            f"-{CLEAN_SHORT_OPTION}",
-            f"--{CLEAN_LONG_OPTION}",
-            action="store_true",
-            help="clean PWD of the contents added by setup subcommand",
-        )
+def retrieve_cmd_args():
+    """How arguments are retrieved from the command line.
 
+    Returns
+    -------
+    Namespace
+        An object that holds attributes pulled from the command line.
+
+    Raises
+    ------
+    SystemExit
+        If user input is not considered valid when parsing arguments.
+
+    """
+    _add_subparsers()
+    try:
         args = vars(_arg_parser.parse_args())
         return args
     except SystemExit:
@@ -454,53 +582,87 @@ def retrieve_cmd_args():
         sys.exit(1)
 
 
-def _clone_git_repos(repo_urls, dest=os.getcwd()):
+def _clone_git_repo(repo_url, dest):
+    """Fetch/clone a git repo.
+
+    Parameters
+    ----------
+    repo_url : str
+        Git repo url to make a working copy of.
+    dest : str
+        Destination path where the git repo will be cloned to.
+
+    """
+    repo_name = os.path.basename(repo_url)
+    # only the files at the tip of the default branch are ever read
+    subprocess.run(
+        [
+            "git",
+            "clone",
+            "--quiet",
+            "--depth=1",
+            "--single-branch",
+            repo_url,
+            repo_name,
+        ],
+        cwd=dest,
+        # git is run with --quiet, only stderr is kept for error reporting
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+        check=True,
+    )
+
+
+def _clone_git_repos(repo_urls_and_dests):
     """Fetch/clone git repos.
 
     Parameters
     ----------
-    repo_urls : list of str
-        Git repo urls to make working copies of.
-    dest : str, optional
-        Destination path where the git repos will be
-        cloned to.
+    repo_urls_and_dests : list of tuple of str
+        Git repo urls to make working copies of, each paired with the
+        destination path where that git repo will be cloned to.
 
     Raises
     ------
     FileNotFoundError:
         If the git executable does not exist in the PATH.
 
+    Notes
+    -----
+    Each clone is independent and mostly waits on the network, so the clones
+    are ran concurrently (up to MAX_GIT_CLONE_JOBS at a time), regardless
+    of their destination.
+
     """
-    # so I remember, finally always executes from try-except-else-finally
+    if not repo_urls_and_dests:
+        return
+    repo_urls, dests = zip(*repo_urls_and_dests)
     try:
-        if not pathlib.Path(dest).exists():
-            os.mkdir(dest)
-        os.chdir(dest)
-        for repo_url in repo_urls:
-            repo_name = os.path.basename(repo_url)
-            subprocess.run(
-                ["git", "clone", "--quiet", repo_url, repo_name],
-                capture_output=True,
-                encoding="utf-8",
-                check=True,
-            )
+        for dest in set(dests):
+            if not pathlib.Path(dest).exists():
+                os.mkdir(dest)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(MAX_GIT_CLONE_JOBS, len(repo_urls))
+        ) as executor:
+            # consuming the results re-raises the first exception, if any
+            list(executor.map(_clone_git_repo, repo_urls, dests))
     except FileNotFoundError as e:
         print(
             f"{_PROGRAM_NAME}: {e.filename} cannot be found in the PATH!",
             file=sys.stderr,
         )
         sys.exit(1)
-    finally:
-        os.chdir(_PROGRAM_ROOT)
 
 
 def _get_vcs_repos():
-    """Get the vcs repo names.
+    """Get the vcs repo paths.
 
     Returns
     -------
-    repo_names : list of str
-        Version source control (e.g. git, mercurial) repo names.
+    repo_paths : list of pathlib.Path
+        Absolute paths to the version source control (e.g. git, mercurial)
+        repos.
 
     Raises
     ------
@@ -508,11 +670,8 @@ def _get_vcs_repos():
         If PROJECTS_DIR_PATH could not be found.
 
     """
-    if pathlib.Path(PROJECTS_DIR_PATH).exists():
-        os.chdir(PROJECTS_DIR_PATH)
-        repo_names = os.listdir()
-        os.chdir(_PROGRAM_ROOT)
-        return repo_names
+    if _PROJECTS_DIR.exists():
+        return [path for path in _PROJECTS_DIR.iterdir() if path.is_dir()]
     else:
         # this means someone did not run the program 'setup' first
         print(
@@ -523,23 +682,26 @@ def _get_vcs_repos():
         sys.exit(1)
 
 
-def _load_casc(casc_path):
+def _load_casc(casc_path, safe_load=False):
     """Load the casc contents.
 
     Parameters
     ----------
     casc_path : str
         Path of the casc file.
+    safe_load : bool, optional
+        Whether or not to load the casc with the faster safe loader.
 
     Returns
     -------
-    ruamel.yaml.comments.CommentedMap
+    dict
         The casc file contents.
 
     Raises
     ------
     SystemExit
-        If the casc file does not meet the casc file requirements.
+        If the base image repo could not be found, or if the casc file does
+        not meet the casc file requirements.
 
     See Also
     --------
@@ -555,11 +717,18 @@ def _load_casc(casc_path):
         # By default, the base image's casc yaml will be loaded. The
         # yaml will be searched for, inspected, then the path to the
         # yaml file is set.
-        os.chdir(DEFAULT_BASE_IMAGE_REPO_NAME)
+        if not _DEFAULT_BASE_IMAGE_REPO_DIR.exists():
+            # this means someone did not run the program 'setup' first
+            print(
+                f"{_PROGRAM_NAME}: '{DEFAULT_BASE_IMAGE_REPO_NAME}' could "
+                "not be found",
+                file=sys.stderr,
+            )
+            sys.exit(1)
 
-        casc_meta = JcascFile("casc", CASC_FILENAME_REGEX)
+        casc_meta = JcascFile("casc", _CASC_FILENAME_RE)
         casc_file_paths = _find_jcasc_files(
-            casc_meta, pathlib.Path(os.getcwd())
+            casc_meta, _DEFAULT_BASE_IMAGE_REPO_DIR
         )
 
         # DISCUSS(cavcrosby): the following func just checks to make sure only
@@ -571,9 +740,9 @@ def _load_casc(casc_path):
             sys.exit(1)
 
         casc_path = casc_file_paths[0]
-        os.chdir(_PROGRAM_ROOT)
-    with open(casc_path, "r") as casc_target:
-        return YAML_PARSER.load(casc_target)
+    # by default loaded round-trip, so the casc's comments, tags, anchors and
+    # scalar formatting are kept when it is dumped
+    return _casc_loader(safe_load).load(pathlib.Path(casc_path))
 
 
 def _load_configs():
@@ -591,6 +760,8 @@ def _load_configs():
         syntax error.
 
     """
+    import toml
+
     try:
         return toml.load(GIT_CONFIG_FILE_PATH)
     except toml.decoder.TomlDecodeError as e:
@@ -603,40 +774,56 @@ def _load_configs():
         sys.exit(1)
 
 
-def _merge_casc(casc_path, into):
+def _merge_casc(casc_path, into, safe_load=False):
     """Merge a casc file with another casc file's contents.
 
     Parameters
     ----------
     casc_path : str
         Path of the casc file to merge.
-    into : ruamel.yaml.comments.CommentedMap
+    into : dict
         The casc file contents who we wish to merge into.
+    safe_load : bool, optional
+        Whether or not to load the casc with the faster safe loader, this
+        should match how the casc merged into was loaded.
 
     Raises
     ------
-    SystemExit
+    FileNotFoundError
         If the casc path does not exist on the filesystem.
 
     """
+    # loaded with the same parser as the casc merged into, so the merged
+    # nodes keep their tags and formatting too
+    casc = _casc_loader(safe_load).load(pathlib.Path(casc_path))
+    _merge_casc_nodes(casc, into)
 
-    def __merge_casc_(casc_ptr, into_ptr=into):
-        """Traverse the casc, merging it with the other casc."""
-        for key in casc_ptr.keys():
-            if into_ptr.get(key, default=None) is None:
-                into_ptr[key] = casc_ptr[key]
-            elif isinstance(into_ptr[key], ruamel.yaml.comments.CommentedMap):
+
+def _merge_casc_nodes(casc_ptr, into_ptr):
+    """Traverse the casc, merging it with the other casc.
+
+    Parameters
+    ----------
+    casc_ptr : dict
+        A node of the casc file contents to merge.
+    into_ptr : dict
+        The matching node of the casc file contents who we wish to merge
+        into.
+
+    """
+    # An explicit stack of node pairs still to merge, this avoids a Python
+    # frame per nested mapping and cannot hit the recursion limit.
+    nodes_to_merge = [(casc_ptr, into_ptr)]
+    while nodes_to_merge:
+        casc_node, into_node = nodes_to_merge.pop()
+        for key, value in casc_node.items():
+            into_value = into_node.get(key)
+            if isinstance(into_value, dict) and isinstance(value, dict):
                 # If the child node is also a parent node, we will want to
                 # iterate until we get to the bottom.
-                __merge_casc_(casc_ptr[key], into_ptr[key])
+                nodes_to_merge.append((value, into_value))
             else:
-                into_ptr.update(casc_ptr)
-
-    # 'as' variable name inspired from Python stdlib documentation:
-    # https://docs.python.org/3/reference/compound_stmts.html#grammar-token-with-stmt
-    with open(casc_path, "r") as casc_target:
-        casc = YAML_PARSER.load(casc_target)
-        __merge_casc_(casc)
+                into_node[key] = value
 
 
 def _transform_rffw(repo_name, job_dsl):
@@ -657,36 +844,37 @@ def _transform_rffw(repo_name, job_dsl):
         initally exist.
 
     """
+    # a cheap substring probe, most job-dsls never call readFileFromWorkspace
+    if READ_FILE_FROM_WORKSPACE_CALL not in job_dsl:
+        return job_dsl
+
+    # built once per job-dsl rather than once per expression
+    repo_path_prefix = f"./{REPOS_TO_TRANSFER_DIR_NAME}/{repo_name}/"
+    (
+        t_rffw_exp_head,
+        _,
+        t_rffw_exp_tail,
+    ) = READ_FILE_FROM_WORKSPACE_EXPRESSION_REPLACEMENT.partition(
+        READ_FILE_FROM_WORKSPACE_ARGUMENT_PLACEHOLDER
+    )
+
     # assuming the job-dsl created also assumes the PWD == WORKSPACE
+    # A job-dsl tends to read the same file more than once, each distinct
+    # expression is only transformed the first time it is found. The cache
+    # lives as long as this call, repo names differ between calls.
+    @functools.lru_cache(maxsize=None)
     def _transform_rffw_exp(rffw_exp):
 
-        rffw_arg = re.search(
-            READ_FILE_FROM_WORKSPACE_ARGUMENT_REGEX, rffw_exp
-        )[0]
-        t_rffw_arg = re.sub(
-            PWD_IDENTIFIER_REGEX,
-            f"./{REPOS_TO_TRANSFER_DIR_NAME}/{repo_name}/",
-            rffw_arg,
-        )
+        rffw_arg = _READ_FILE_FROM_WORKSPACE_ARGUMENT_RE.search(rffw_exp)[0]
+        t_rffw_arg = rffw_arg.replace(PWD_IDENTIFIER, repo_path_prefix)
         # t_rffw_exp
-        return READ_FILE_FROM_WORKSPACE_EXPRESSION_REPLACEMENT.replace(
-            READ_FILE_FROM_WORKSPACE_ARGUMENT_PLACEHOLDER,
-            t_rffw_arg,
-        )
+        return t_rffw_exp_head + t_rffw_arg + t_rffw_exp_tail
 
-    rffw_exps = dict()
-    for rffw_exp in re.findall(
-        READ_FILE_FROM_WORKSPACE_EXPRESSION_REGEX, job_dsl
-    ):
-        rffw_exps[rffw_exp] = _transform_rffw_exp(rffw_exp)
-    # rffw_exp may need to have some characters escaped e.g. '(', ')', '.'
-    for rffw_exp, t_rffw_exp in rffw_exps.items():
-        job_dsl = re.sub(
-            re.escape(rffw_exp),
-            t_rffw_exp,
-            job_dsl,
-        )
-    return job_dsl
+    # each expression is transformed as it is found, in one pass over the
+    # job-dsl
+    return _READ_FILE_FROM_WORKSPACE_EXPRESSION_RE.sub(
+        lambda match: _transform_rffw_exp(match[0]), job_dsl
+    )
 
 
 def _addagent_placeholder(num_of_agents, casc):
@@ -696,7 +884,7 @@ def _addagent_placeholder(num_of_agents, casc):
     ----------
     num_of_agents : int
         The number of agent placeholders to add to the casc.
-    casc : ruamel.yaml.comments.CommentedMap
+    casc : dict
         The casc file contents.
 
     Notes
@@ -726,83 +914,56 @@ def _addagent_placeholder(num_of_agents, casc):
         retentionStrategy: "always"
 
     """
-    casc_ptr = casc
-    if JENKINS_ROOT_KEY_YAML not in casc_ptr:
-        casc_ptr[JENKINS_ROOT_KEY_YAML] = []
-    casc_ptr = casc_ptr[JENKINS_ROOT_KEY_YAML]
-    if JENKINS_NODES_KEY_YAML not in casc_ptr:
-        casc_ptr[JENKINS_NODES_KEY_YAML] = []
-    casc_ptr = casc_ptr[JENKINS_NODES_KEY_YAML]
+    agents = casc.setdefault(JENKINS_ROOT_KEY_YAML, {}).setdefault(
+        JENKINS_NODES_KEY_YAML, []
+    )
     for index in range(1, num_of_agents + 1):
-        casc_ptr.append(
-            dict(
-                [
-                    (
-                        PERMANENT_KEY_YAML,
-                        dict(
-                            [
-                                (
-                                    LAUNCHER_KEY_YAML,
-                                    dict(
-                                        [
-                                            (
-                                                JNLP_KEY_YAML,
-                                                dict(
-                                                    [
-                                                        (
-                                                            WORKDIRSETTINGS_KEY_YAML,
-                                                            dict(
-                                                                [
-                                                                    (
-                                                                        DISABLED_KEY_YAML,
-                                                                        "false",
-                                                                    ),
-                                                                    (
-                                                                        FAIL_IF_WORKING_DIR_IS_MISSING_KEY_YAML,
-                                                                        "false",
-                                                                    ),
-                                                                    (
-                                                                        INTERNALDIR_KEY_YAML,
-                                                                        "remoting",
-                                                                    ),
-                                                                ]
-                                                            ),
-                                                        )
-                                                    ]
-                                                ),
-                                            )
-                                        ]
-                                    ),
-                                ),
-                                (
-                                    NAME_KEY_YAML,
-                                    f"${{{NAME_ENV_VAR_NAME}{index}}}",
-                                ),
-                                (
-                                    NODE_DESCRIPTION_KEY_YAML,
-                                    f"${{{NODE_DESCRIPTION_ENV_VAR_NAME}{index}}}",
-                                ),
-                                (
-                                    NUM_EXECUTORS_KEY_YAML,
-                                    f"${{{NUM_EXECUTORS_ENV_VAR_NAME}{index}}}",
-                                ),
-                                (
-                                    REMOTEFS_KEY_YAML,
-                                    f"${{{REMOTEFS_ENV_VAR_NAME}{index}}}",
-                                ),
-                                (
-                                    RENTENTION_STRATEGY_KEY_YAML,
-                                    "always",
-                                ),
-                            ]
-                        ),
-                    )
-                ]
-            )
-        )
+        agents.append(_make_agent_placeholder(index))
+
 
+def _make_agent_placeholder(index):
+    """Make a Jenkins agent placeholder.
 
-def _addjobs(t_rffw, repo_names, casc):
+    Parameters
+    ----------
+    index : int
+        The number appended to the env var names of the placeholder.
+
+    Returns
+    -------
+    dict
+        The Jenkins agent placeholder.
+
+    See Also
+    --------
+    _addagent_placeholder
+
+    """
+    return {
+        PERMANENT_KEY_YAML: {
+            LAUNCHER_KEY_YAML: {
+                JNLP_KEY_YAML: {
+                    WORKDIRSETTINGS_KEY_YAML: {
+                        DISABLED_KEY_YAML: "false",
+                        FAIL_IF_WORKING_DIR_IS_MISSING_KEY_YAML: "false",
+                        INTERNALDIR_KEY_YAML: "remoting",
+                    }
+                }
+            },
+            NAME_KEY_YAML: f"${{{NAME_ENV_VAR_NAME}{index}}}",
+            NODE_DESCRIPTION_KEY_YAML: (
+                f"${{{NODE_DESCRIPTION_ENV_VAR_NAME}{index}}}"
+            ),
+            NUM_EXECUTORS_KEY_YAML: (
+                f"${{{NUM_EXECUTORS_ENV_VAR_NAME}{index}}}"
+            ),
+            REMOTEFS_KEY_YAML: f"${{{REMOTEFS_ENV_VAR_NAME}{index}}}",
+            RENTENTION_STRATEGY_KEY_YAML: "always",
+        }
+    }
+
+
+def _addjobs(t_rffw, repo_paths, casc):
     """Add job-dsl(s) to casc.
 
     Parameters
@@ -810,9 +971,10 @@ def _addjobs(t_rffw, repo_names, casc):
     t_rffw : bool
         Whether or not to transform 'readFileFromWorkspace' (rffw) expressions
         from job-dsl(s).
-    repo_names : list of str
-        Version source control (e.g. git, mercurial) repo names.
-    casc : ruamel.yaml.comments.CommentedMap
+    repo_paths : list of pathlib.Path
+        Absolute paths to the version source control (e.g. git, mercurial)
+        repos.
+    casc : dict
         The casc file contents.
 
     See Also
@@ -820,46 +982,40 @@ def _addjobs(t_rffw, repo_names, casc):
     _transform_rffw
 
     """
-    os.chdir(PROJECTS_DIR_PATH)
-    for repo_name in repo_names:
-        try:
-            os.chdir(repo_name)
+    # import inspired from:
+    # https://stackoverflow.com/questions/35433838/how-to-dump-a-folded-scalar-to-yaml-in-python-using-ruamel#answer-51980082
+    from ruamel.yaml.scalarstring import FoldedScalarString
+
+    job_dsl_meta = JcascFile(
+        "job-dsl",
+        _JOB_DSL_FILENAME_RE,
+        JcascFile.DEFAULT_DIR_PATH,
+        ".jenkins",
+    )
+    # whether to transform is decided once, not per job-dsl
+    transform_job_dsl = (
+        _transform_rffw if t_rffw else lambda repo_name, job_dsl: job_dsl
+    )
+    jobs = []
+    for repo_path in repo_paths:
+        repo_name = repo_path.name
+        job_dsl_file_paths = _find_jcasc_files(job_dsl_meta, repo_path)
+        # DISCUSS(cavcrosby): the following func just checks to make sure
+        # only one job-dsl file exists in the repo. Has nothing todo with
+        # the actual job-dsl file or contents itself.
+        if not _meets_job_dsl_filereqs(repo_name, job_dsl_file_paths):
+            continue
 
-            job_dsl_meta = JcascFile(
-                "job-dsl",
-                JOB_DSL_FILENAME_REGEX,
-                JcascFile.DEFAULT_DIR_PATH,
-                ".jenkins",
-            )
-            job_dsl_file_paths = _find_jcasc_files(
-                job_dsl_meta, pathlib.Path(os.getcwd())
-            )
-            # DISCUSS(cavcrosby): the following func just checks to make sure
-            # only one job-dsl file exists in the repo. Has nothing todo with
-            # the actual job-dsl file or contents itself.
-            if not _meets_job_dsl_filereqs(repo_name, job_dsl_file_paths):
-                os.chdir("..")
-                continue
-
-            job_dsl_file_path = job_dsl_file_paths[0]
-            with open(job_dsl_file_path, "r") as job_dsl_target:
-                job_dsl = job_dsl_target.read()
-            if t_rffw:
-                job_dsl = _transform_rffw(repo_name, job_dsl)
-
-            # inspired from:
-            # https://stackoverflow.com/questions/35433838/how-to-dump-a-folded-scalar-to-yaml-in-python-using-ruamel
-            job_dsl_folded = scalarstring.FoldedScalarString(job_dsl)
-            if JOB_DSL_ROOT_KEY_YAML not in casc:
-                casc[JOB_DSL_ROOT_KEY_YAML] = list()
-            # dict([('sape', 4139)]) ==> {'sape': 4139}
-            casc[JOB_DSL_ROOT_KEY_YAML].append(
-                dict([(JOB_DSL_SCRIPT_KEY_YAML, job_dsl_folded)])
-            )
-        finally:
-            os.chdir(PROJECTS_DIR_PATH)
-    # to re-establish being back at the project/program root
-    os.chdir(_PROGRAM_ROOT)
+        job_dsl = transform_job_dsl(
+            repo_name, pathlib.Path(job_dsl_file_paths[0]).read_text()
+        )
+
+        # inspired from:
+        # https://stackoverflow.com/questions/35433838/how-to-dump-a-folded-scalar-to-yaml-in-python-using-ruamel
+        jobs.append({JOB_DSL_SCRIPT_KEY_YAML: FoldedScalarString(job_dsl)})
+
+    if jobs:
+        casc.setdefault(JOB_DSL_ROOT_KEY_YAML, []).extend(jobs)
 
 
 def main():
@@ -870,27 +1026,36 @@ def main():
         if args[SUBCOMMAND] == SETUP_SUBCOMMAND:
             configs = _load_configs()
             if args[CLEAN_LONG_OPTION]:
-                if pathlib.Path(PROJECTS_DIR_PATH).exists():
+                if _PROJECTS_DIR.exists():
                     shutil.rmtree(PROJECTS_DIR_PATH)
-                if pathlib.Path(DEFAULT_BASE_IMAGE_REPO_NAME).exists():
-                    shutil.rmtree(DEFAULT_BASE_IMAGE_REPO_NAME)
+                if _DEFAULT_BASE_IMAGE_REPO_DIR.exists():
+                    shutil.rmtree(_DEFAULT_BASE_IMAGE_REPO_DIR)
             else:
+                # created even without any repos to clone, a casc that only
+                # gets agent placeholders is still a valid setup
+                os.makedirs(PROJECTS_DIR_PATH, exist_ok=True)
+                # the project repos and the base image repo are cloned
+                # together, rather than one group after the other
                 _clone_git_repos(
-                    configs["git"]["repo_urls"],
-                    dest=PROJECTS_DIR_PATH,
+                    [
+                        (repo_url, PROJECTS_DIR_PATH)
+                        for repo_url in configs["git"]["repo_urls"]
+                    ]
+                    + [(DEFAULT_BASE_IMAGE_REPO_URL, _PROGRAM_ROOT)]
                 )
-                _clone_git_repos([DEFAULT_BASE_IMAGE_REPO_URL])
         elif (
             args[SUBCOMMAND] == ADDJOBS_SUBCOMMAND
             or args[SUBCOMMAND]  # noqa: W503
             == ADDAGENT_PLACEHOLDER_SUBCOMMAND  # noqa: W503
         ):
-            casc = _load_casc(args[CASC_PATH_LONG_OPTION])
+            casc = _load_casc(
+                args[CASC_PATH_LONG_OPTION], args[SAFE_LOAD_LONG_OPTION]
+            )
             if args[SUBCOMMAND] == ADDJOBS_SUBCOMMAND:
-                repo_names = _get_vcs_repos()
+                repo_paths = _get_vcs_repos()
                 _addjobs(
                     args[TRANSFORM_READ_FILE_FROM_WORKSPACE_LONG_OPTION],
-                    repo_names,
+                    repo_paths,
                     casc,
                 )
             if args[SUBCOMMAND] == ADDAGENT_PLACEHOLDER_SUBCOMMAND:
@@ -898,19 +1063,21 @@ def main():
                     args[NUM_OF_AGENTS_TO_ADD_LONG_OPTION], casc
                 )
             if args[MERGE_CASC_LONG_OPTION]:
-                _merge_casc(args[MERGE_CASC_LONG_OPTION], into=casc)
+                _merge_casc(
+                    args[MERGE_CASC_LONG_OPTION],
+                    into=casc,
+                    safe_load=args[SAFE_LOAD_LONG_OPTION],
+                )
+            # The emitter makes many small writes, so the casc is dumped in
+            # memory and then written out all at once.
+            casc_stream = io.StringIO()
+            _yaml_parser().dump(casc, casc_stream)
+            casc_yaml = casc_stream.getvalue()
             if args[ENV_VAR_LONG_OPTION]:
-                YAML_PARSER.dump(
-                    casc,
-                    DEFAULT_STDOUT_FD,
-                    transform=(
-                        lambda string: _expand_env_vars(
-                            string, args[ENV_VAR_LONG_OPTION]
-                        )
-                    ),
+                casc_yaml = _expand_env_vars(
+                    casc_yaml, args[ENV_VAR_LONG_OPTION]
                 )
-            else:
-                YAML_PARSER.dump(casc, DEFAULT_STDOUT_FD)
+            DEFAULT_STDOUT_FD.write(casc_yaml)
         sys.exit(0)
     except subprocess.CalledProcessError as e:
         # why yes, this is like the traceback.print_exception message!